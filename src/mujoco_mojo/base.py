@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Sequence
-from typing import ClassVar
+from typing import Any, Callable, ClassVar, TextIO
 from xml.etree.ElementTree import Element
+from xml.sax.saxutils import quoteattr
 
 import numpy as np
 from pydantic import BaseModel, model_validator
@@ -17,21 +19,61 @@ def _tuple_string(v) -> str:
     Works with list, tuple, or NumPy ndarray.
     """
 
+    if isinstance(v, np.ndarray):
+        # tolist() converts to builtin scalars in one C call, which str()
+        # formats much faster than NumPy scalars one element at a time
+        v = v.tolist()
+
     return " ".join(map(str, v))
 
 
+def _set_string(v) -> str:
+    """
+
+    Convert a set of numbers into a sorted space-separated string.
+    Sorted for deterministic output (sets such as Option.actuatorgroupdisable
+    are internally a bitfield, so order carries no meaning).
+    """
+
+    return " ".join(map(str, sorted(v)))
+
+
+_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    bool: lambda v: "true" if v else "false",
+    np.ndarray: _tuple_string,
+    list: _tuple_string,
+    tuple: _tuple_string,
+    set: _set_string,
+    frozenset: _set_string,
+    str: str,
+    int: str,
+    float: str,
+    np.float64: str,
+}
+"""Formatter per concrete value type, so the common case is one dict lookup instead of an isinstance chain."""
+
+
 def _format_value(value) -> str:
     """
 
     Convert a Python value into a string suitable for XML attributes.
     - Booleans become "true"/"false"
+    - Sets become sorted space-separated strings
     - Sequences (list, tuple, np.ndarray) become space-separated strings
     - Everything else is cast to str
     """
 
+    formatter = _FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+
+    # subclasses (NumPy scalars, StrEnum members, ...) take the generic path
     if isinstance(value, bool):
         return "true" if value else "false"
 
+    if isinstance(value, (set, frozenset)):
+        return _set_string(value)
+
     if isinstance(value, (Sequence, np.ndarray)) and not isinstance(value, str):
         return _tuple_string(value)
 
@@ -53,19 +95,46 @@ class XMLModel(BaseModel):
     __exclusive_groups__: tuple[tuple[str, ...], ...] = ()
     """Attributes which if defined simultaneously will result in an error."""
 
+    _xml_attr_plan: ClassVar[tuple[tuple[str, str, Any], ...]] = ()
+    """Per-class serialization plan of `(field_name, xml_name, default)` triples.
+
+    Computed once at class creation so `to_xml` does not re-derive XML names and
+    field defaults on every call."""
+
     # TODO add argument which will ignore fields with defaults (if they are default, call it `exclude_default`)
     def to_xml(self, exclude_default: bool = True) -> Element:
-        el = Element(self.tag)
+        el = Element(self.tag, self._xml_attributes(exclude_default))
+
+        # children (unchanged)
+        for field in self.children:
+            value = getattr(self, field, None)
+
+            if value is None:
+                continue
+
+            if isinstance(value, list):
+                for item in value:
+                    el.append(item.to_xml(exclude_default))
+            else:
+                el.append(value.to_xml(exclude_default))
+
+        return el
+
+    def _xml_attributes(self, exclude_default: bool = True) -> dict[str, str]:
+        """Format this model's own XML attributes into a dict.
+
+        Accumulated in a plain dict so callers apply them in one go rather
+        than set() one at a time.
+        """
+
+        attrs: dict[str, str] = {}
 
         # attributes (deterministic)
-        for field in self.attributes:
+        for field, field_name, default in self._xml_attr_plan:
             value = getattr(self, field, None)
 
             if exclude_default:
-                # determine default value
-                default = type(self).model_fields[field].default
-
-                # determine if its equal to value
+                # determine if value is equal to the default
                 if isinstance(value, np.ndarray):
                     is_default = np.array_equal(value, default)
                 else:
@@ -77,8 +146,6 @@ class XMLModel(BaseModel):
             if value is None:
                 continue
 
-            field_name = field.rstrip("_")
-
             # attribute is an XMLModel (to be flattened)
             if isinstance(value, XMLModel):
                 # safety checks
@@ -92,31 +159,50 @@ class XMLModel(BaseModel):
 
                 # collision detection
                 for k in sub_attrs:
-                    if k in el.attrib:
+                    if k in attrs:
                         raise ValueError(
                             f"Attribute collision while flattening {value.__class__.__name__}: '{k}' already exists"
                         )
 
-                el.attrib.update(sub_attrs)
+                attrs.update(sub_attrs)
                 continue
 
             # normal attribute
-            el.set(field_name, _format_value(value))
+            attrs[field_name] = _format_value(value)
 
-        # children (unchanged)
+        return attrs
+
+    def write_xml(self, stream: TextIO, exclude_default: bool = True) -> None:
+        """Serialize straight to a text stream, StAX-style.
+
+        Unlike `to_xml`, no intermediate Element tree is built: each element
+        is written (and garbage collected) as soon as it is visited, so memory
+        stays flat regardless of model size.
+        """
+
+        write = stream.write
+        write(f"<{self.tag}")
+
+        for key, value in self._xml_attributes(exclude_default).items():
+            write(f" {key}={quoteattr(value)}")
+
+        opened = False
         for field in self.children:
             value = getattr(self, field, None)
 
             if value is None:
                 continue
 
-            if isinstance(value, list):
-                for item in value:
-                    el.append(item.to_xml())
-            else:
-                el.append(value.to_xml())
+            for child in value if isinstance(value, list) else (value,):
+                if not opened:
+                    write(">")
+                    opened = True
+                child.write_xml(stream, exclude_default)
 
-        return el
+        if opened:
+            write(f"</{self.tag}>")
+        else:
+            write(" />")
 
     def _collect_xml_attributes(self) -> dict[str, str]:
         """
@@ -131,14 +217,12 @@ class XMLModel(BaseModel):
             )
 
         attrs: dict[str, str] = {}
-        for field in self.attributes:
+        for field, key, _default in self._xml_attr_plan:
             value = getattr(self, field, None)
 
             if value is None:
                 continue
 
-            key = field.rstrip("_")
-
             if isinstance(value, XMLModel):
                 nested = value._collect_xml_attributes()
 
@@ -190,6 +274,23 @@ class XMLModel(BaseModel):
                     f"as a field or class variable"
                 )
 
+        # Precompute the serialization plan (XML names and field defaults) once
+        # per class so it is not re-derived on every to_xml() call. Tag and
+        # attribute names are interned: the same names repeat across thousands
+        # of emitted elements, so interning dedupes them and makes dict
+        # lookups on them pointer comparisons.
+        if isinstance(getattr(cls, "tag", None), str):
+            cls.tag = sys.intern(cls.tag)
+
+        cls._xml_attr_plan = tuple(
+            (
+                name,
+                sys.intern(name.rstrip("_")),
+                cls.model_fields[name].default if name in cls.model_fields else None,
+            )
+            for name in cls.attributes
+        )
+
     @model_validator(mode="after")
     def enforce_exclusive_groups(self) -> XMLModel:
         """Ensures that only one attribute in each exclusive group is set."""
@@ -18,3 +18,9 @@ SOLREF_DEFAULT: Vec2 = np.array((0.02, 1))
 
 FRICTION_DEFAULT: Vec3 = np.array((1, 0.005, 0.0001))
 """Default friction definition. The values are coefficients for `sliding`, `torsion`, and `rolling`."""
+
+# Pydantic deep-copies these defaults into each instance, so instance arrays
+# are independent and writeable regardless; the freeze only protects the
+# importable constants themselves from accidental in-place edits.
+for _default in (SOLIMP_DEFAULT, SOLREF_DEFAULT, FRICTION_DEFAULT):
+    _default.setflags(write=False)
@@ -20,6 +20,15 @@ from mujoco_mojo.typing import (
 
 __all__ = ["Option"]
 
+# Read-only module-level default vectors (see mujoco_mojo.mjcf.defaults for
+# the freeze rationale); built once at import instead of per class definition.
+_GRAVITY_DEFAULT: Vec3 = np.array((0, 0, -9.81))
+_WIND_DEFAULT: Vec3 = np.array((0, 0, 0))
+_MAGNETIC_DEFAULT: Vec3 = np.array((0, -0.5, 0))
+
+for _default in (_GRAVITY_DEFAULT, _WIND_DEFAULT, _MAGNETIC_DEFAULT):
+    _default.setflags(write=False)
+
 
 class Option(XMLModel):
     """This element is in one-to-one correspondence with the low level structure mjOption contained in the field mjModel.opt of mjModel. These are simulation options and do not affect the compilation process in any way; they are simply copied into the low level model. Even though mjOption can be modified by the user at runtime, it is nevertheless a good idea to adjust it properly through the XML."""
@@ -63,13 +72,13 @@ class Option(XMLModel):
     impratio: float = 1
     """This attribute determines the ratio of frictional-to-normal constraint impedance for elliptic friction cones. The setting of solimp determines a single impedance value for all contact dimensions, which is then modulated by this attribute. Settings larger than 1 cause friction forces to be "harder" than normal forces, having the general effect of preventing slip, without increasing the actual friction coefficient. For pyramidal friction cones the situation is more complex because the pyramidal approximation mixes normal and frictional dimensions within each basis vector; it is not recommended to use high impratio values with pyramidal cones."""
 
-    gravity: Vec3 = np.array((0, 0, -9.81))
+    gravity: Vec3 = _GRAVITY_DEFAULT
     """Gravitational acceleration vector. In the default world orientation the Z-axis points up. The MuJoCo GUI is organized around this convention (both the camera and perturbation commands are based on it) so we do not recommend deviating from it."""
 
-    wind: Vec3 = np.array((0, 0, 0))
+    wind: Vec3 = _WIND_DEFAULT
     """Velocity vector of the medium (i.e., wind). This vector is subtracted from the 3D translational velocity of each body, and the result is used to compute viscous, lift and drag forces acting on the body; recall Passive forces in the Computation chapter. The magnitude of these forces scales with the values of the next two attributes."""
 
-    magnetic: Vec3 = np.array((0, -0.5, 0))
+    magnetic: Vec3 = _MAGNETIC_DEFAULT
     """Global magnetic flux. This vector is used by magnetometer sensors, which are defined as sites and return the magnetic flux at the site position expressed in the site frame."""
 
     density: float = 0
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from pydantic import field_validator
+
 from mujoco_mojo.base import XMLModel
 
 __all__ = ["Size"]
 
+_MEMORY_UNIT_SHIFT = {"K": 10, "M": 20, "G": 30, "T": 40, "P": 50, "E": 60}
+"""Bit shift per memory unit suffix, so e.g. `"16M"` resolves as `16 << 20` bytes."""
+
 
 class Size(XMLModel):
     """This element specifies size parameters that cannot be inferred from the number of elements in the model. Unlike the fields of mjOption which can be modified at runtime, sizes are structural parameters and should not be modified after compilation."""
@@ -56,3 +61,32 @@ class Size(XMLModel):
 
     nuser_sensor: int = -1
     """The number of custom user parameters added to the definition of each sensor."""
+
+    @field_validator("memory")
+    @classmethod
+    def _check_memory(cls, v: str) -> str:
+        """Validates that memory is `-1` or digits with an optional unit suffix."""
+
+        shift = _MEMORY_UNIT_SHIFT.get(v[-1:], 0)
+        digits = v[:-1] if shift else v
+
+        # the -1 sentinel is only valid bare: "-1K" would otherwise resolve
+        # to -1024 bytes, which is neither a size nor the sentinel
+        if not digits.isdigit() and (shift or digits != "-1"):
+            raise ValueError(
+                f"memory must be '-1' or digits with an optional unit suffix "
+                f"{{K, M, G, T, P, E}}, got {v!r}"
+            )
+
+        return v
+
+    def memory_bytes(self) -> int:
+        """Return the requested arena size in bytes, or -1 for the compiler default.
+
+        The unit suffix is resolved with a single table lookup rather than
+        branching per letter."""
+
+        memory = self.memory
+        shift = _MEMORY_UNIT_SHIFT.get(memory[-1], 0)
+        digits = memory[:-1] if shift else memory
+        return int(digits) << shift
@@ -35,10 +35,3 @@ class Statistic(XMLModel):
 
     center: Optional[Vec3] = None
     """If this attribute is specified, it replaces the value of mjModel.stat.center computed by the compiler. The computed value is the center of the bounding box of the entire model in the initial configuration. This 3D vector is used to center the view of the free camera when the model is first loaded."""
-
-
-if __name__ == "__main__":
-    import numpy as np
-
-    x = Statistic(center=np.array([1.0, 2, 3]))
-    breakpoint()
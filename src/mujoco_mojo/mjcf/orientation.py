@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-from enum import StrEnum, auto
-from typing import Annotated, Literal, Optional
+import math
+from functools import cache
+from typing import Annotated, Any, Literal, Optional, Sequence
 
 import numpy as np
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 from scipy.spatial.transform import Rotation as R
 
 from mujoco_mojo.base import XMLModel
-from mujoco_mojo.typing import EulerSeq, Vec3, Vec4, Vec6
+from mujoco_mojo.typing import EulerSeq, MojoStrEnum, Vec3, Vec4, Vec6
 
 __all__ = [
     "Orientation",
@@ -18,21 +19,41 @@ __all__ = [
     "XYAxes",
     "ZAxis",
     "Euler",
+    "ORIENTATION_CLASSES",
+    "parse_orientation",
+    "as_quats",
 ]
 
-
-class OrientationType(StrEnum):
+# Read-only module-level field defaults (see mujoco_mojo.mjcf.defaults for
+# the freeze rationale); built once at import instead of per class definition.
+_QUAT_DEFAULT: Vec4 = np.array((1, 0, 0, 0))
+_AXISANGLE_DEFAULT: Vec4 = np.array((1, 0, 0, 0))
+_EULER_DEFAULT: Vec3 = np.array((0, 0, 0))
+_XYAXES_DEFAULT: Vec6 = np.array((1, 0, 0, 0, 1, 0))
+_ZAXIS_DEFAULT: Vec3 = np.array((0, 0, 1))
+
+for _default in (
+    _QUAT_DEFAULT,
+    _AXISANGLE_DEFAULT,
+    _EULER_DEFAULT,
+    _XYAXES_DEFAULT,
+    _ZAXIS_DEFAULT,
+):
+    _default.setflags(write=False)
+
+
+class OrientationType(MojoStrEnum):
     """Defines the type field for orientation types (used for discriminated union)."""
 
-    QUAT = auto()
+    QUAT = "quat"
     """Quaternion type."""
-    AXISANGLE = auto()
+    AXISANGLE = "axisangle"
     """Axis angle type."""
-    XYAXES = auto()
+    XYAXES = "xyaxes"
     """XY axes type."""
-    ZAXIS = auto()
+    ZAXIS = "zaxis"
     """Z axis type."""
-    EULER = auto()
+    EULER = "euler"
     """Euler angle type."""
 
 
@@ -46,84 +67,20 @@ class OrientationBase(XMLModel):
     tag = ""
 
     def as_quat(self, eulerseq: Optional[EulerSeq | str] = None) -> Quat:
-        if isinstance(self, Euler) and self.euler is not None and eulerseq is None:
-            raise ValueError(
-                "Unable to return for Euler without specifying the euler angle order (xyz, ZXZ, etc.)"
-            )
         # returns [w, x, y, z] for MuJoCo
         rot = self._to_rotation(eulerseq)
         q = rot.as_quat()  # scipy returns [x, y, z, w]
         return Quat(quat=np.asarray([q[3], q[0], q[1], q[2]]))
 
     def as_matrix(self, eulerseq: Optional[EulerSeq | str] = None):
-        if isinstance(self, Euler) and self.euler is not None and eulerseq is None:
-            raise ValueError(
-                "Unable to return for Euler without specifying the euler angle order (xyz, ZXZ, etc.)"
-            )
         return self._to_rotation(eulerseq).as_matrix()
 
     def _to_rotation(self, eulerseq: Optional[EulerSeq | str] = None) -> R:
-        # determine the subtype to make a scipy Rotation object
-        if isinstance(self, Quat) and self.quat is not None:
-            quat = np.asarray(self.quat)
-            x, y, z, w = quat[1], quat[2], quat[3], quat[0]
-            return R.from_quat([x, y, z, w])
-        elif isinstance(self, Euler) and self.euler is not None:
-            if eulerseq is None:
-                raise ValueError(
-                    "Unable to return for Euler without specifying the euler angle order (xyz, ZXZ, etc.)"
-                )
-            return R.from_euler(eulerseq, np.asarray(self.euler))
-        # WARNING: I vibecoded the following
-        elif isinstance(self, AxisAngle) and self.axisangle is not None:
-            axisangle = np.asarray(self.axisangle)
-            axis = axisangle[:3]
-            angle = axisangle[3]
-
-            # Normalize the axis vector
-            norm = np.linalg.norm(axis)
-            if norm == 0:
-                raise ValueError(
-                    "Axis vector cannot be zero for AxisAngle orientation."
-                )
-            axis = axis / norm
-
-            # Rotation vector = axis * angle (angle should be in radians)
-            # If angle is in degrees, convert: np.radians(angle)
-            rotvec = axis * angle
-            return R.from_rotvec(rotvec)
-        elif isinstance(self, XYAxes) and self.xyaxes is not None:
-            vecs = np.asarray(self.xyaxes)
-            x = vecs[:3]
-            y = vecs[3:]
-
-            # Orthonormalize Y w.r.t X
-            x = x / np.linalg.norm(x)
-            y = y - np.dot(y, x) * x
-            y = y / np.linalg.norm(y)
-
-            z = np.cross(x, y)
-
-            # Build rotation matrix with columns as axes
-            rotmat = np.column_stack((x, y, z)).astype(float)
-            return R.from_matrix(rotmat)
-        elif isinstance(self, ZAxis) and self.zaxis is not None:
-            z = np.asarray(self.zaxis)
-            z = z / np.linalg.norm(z)
-
-            # Choose arbitrary x-axis that's not colinear with z
-            if np.allclose(z, [0, 0, 1]):
-                # Already aligned, identity rotation
-                return R.identity()
-            else:
-                # pick temp x along world x-axis
-                tmp = np.array([1.0, 0.0, 0.0])
-                x = np.cross(tmp, z)
-                x /= np.linalg.norm(x)
-                y = np.cross(z, x)
-
-                rotmat = np.column_stack((x, y, z))
-                return R.from_matrix(rotmat)
+        """Convert this orientation into a scipy Rotation.
+
+        Each subclass overrides this with its own conversion, so dispatch is a
+        single virtual call rather than an isinstance chain over every subtype.
+        """
 
         raise NotImplementedError(
             f"Rotation matrix transforms has not yet been developed for type ({type(self)})"
@@ -137,7 +94,7 @@ class Quat(OrientationBase):
 
     attributes = ("quat",)
 
-    quat: Vec4 = np.array((1, 0, 0, 0))
+    quat: Vec4 = _QUAT_DEFAULT
     """Orientation of the frame. See Frame orientations. Defined as (w, x, y, z) quaternion order (the same as MuJoCo convention)."""
 
     def __eq__(self, other: object) -> bool:
@@ -145,6 +102,21 @@ class Quat(OrientationBase):
             return NotImplemented
         return np.array_equal(np.asarray(self.quat), np.asarray(other.quat))
 
+    def _to_rotation(self, eulerseq: Optional[EulerSeq | str] = None) -> R:
+        # validation already canonicalized the field to an ndarray
+        quat = self.quat
+        x, y, z, w = quat[1], quat[2], quat[3], quat[0]
+        return R.from_quat([x, y, z, w])
+
+    def as_quat(self, eulerseq: Optional[EulerSeq | str] = None) -> Quat:
+        # already a quaternion: normalize to unit length directly instead of
+        # round-tripping through a scipy Rotation
+        quat = self.quat
+        norm = math.sqrt(quat @ quat)
+        if norm == 0:
+            raise ValueError("Found zero norm quaternions in `quat`.")
+        return Quat(quat=quat / norm)
+
 
 class AxisAngle(OrientationBase):
     """These are the quantities (x,y,z,a) mentioned above. The last number is the angle of rotation, in degrees or radians as specified by the angle attribute of compiler. The first three numbers determine a 3D vector which is the rotation axis. This vector is normalized to unit length during compilation, so the user can specify a vector of any non-zero length. Keep in mind that the rotation is right-handed; if the direction of the vector (x,y,z) is reversed this will result in the opposite rotation. Changing the sign of aa can also be used to specify the opposite rotation."""
@@ -152,7 +124,7 @@ class AxisAngle(OrientationBase):
     type: Literal[OrientationType.AXISANGLE] = OrientationType.AXISANGLE
     attributes = ("axisangle",)
 
-    axisangle: Vec4 = np.array((1, 0, 0, 0))
+    axisangle: Vec4 = _AXISANGLE_DEFAULT
     """Orientation of the frame. See Frame orientations."""
 
     def __eq__(self, other: object) -> bool:
@@ -160,6 +132,40 @@ class AxisAngle(OrientationBase):
             return NotImplemented
         return np.array_equal(np.asarray(self.axisangle), np.asarray(other.axisangle))
 
+    # WARNING: I vibecoded the following
+    def _to_rotation(self, eulerseq: Optional[EulerSeq | str] = None) -> R:
+        axisangle = self.axisangle
+        axis = axisangle[:3]
+        angle = axisangle[3]
+
+        # Normalize the axis vector
+        norm = np.linalg.norm(axis)
+        if norm == 0:
+            raise ValueError("Axis vector cannot be zero for AxisAngle orientation.")
+        axis = axis / norm
+
+        # Rotation vector = axis * angle (angle should be in radians)
+        # If angle is in degrees, convert: np.radians(angle)
+        rotvec = axis * angle
+        return R.from_rotvec(rotvec)
+
+    def as_quat(self, eulerseq: Optional[EulerSeq | str] = None) -> Quat:
+        # closed form: (cos(a/2), sin(a/2) * axis), skipping the scipy
+        # Rotation round-trip
+        axisangle = self.axisangle
+        axis = axisangle[:3]
+        angle = axisangle[3]
+
+        norm = math.sqrt(axis @ axis)
+        if norm == 0:
+            raise ValueError("Axis vector cannot be zero for AxisAngle orientation.")
+
+        half = 0.5 * angle
+        s = math.sin(half) / norm
+        return Quat(
+            quat=np.array((math.cos(half), axis[0] * s, axis[1] * s, axis[2] * s))
+        )
+
 
 class Euler(OrientationBase):
     """Rotation angles around three coordinate axes. The sequence of axes around which these rotations are applied is determined by the eulerseq attribute of compiler and is the same for the entire model."""
@@ -167,7 +173,7 @@ class Euler(OrientationBase):
     type: Literal[OrientationType.EULER] = OrientationType.EULER
     attributes = ("euler",)
 
-    euler: Vec3 = np.array((0, 0, 0))
+    euler: Vec3 = _EULER_DEFAULT
     """Orientation of the frame. See Frame orientations. The sequence of axes around which these rotations are applied is determined by the eulerseq attribute of compiler and is the same for the entire model."""
 
     def __eq__(self, other: object) -> bool:
@@ -175,6 +181,13 @@ class Euler(OrientationBase):
             return NotImplemented
         return np.array_equal(np.asarray(self.euler), np.asarray(other.euler))
 
+    def _to_rotation(self, eulerseq: Optional[EulerSeq | str] = None) -> R:
+        if eulerseq is None:
+            raise ValueError(
+                "Unable to return for Euler without specifying the euler angle order (xyz, ZXZ, etc.)"
+            )
+        return R.from_euler(eulerseq, self.euler)
+
 
 class XYAxes(OrientationBase):
     """The first 3 numbers are the X axis of the frame. The next 3 numbers are the Y axis of the frame, which is automatically made orthogonal to the X axis. The Z axis is then defined as the cross-product of the X and Y axes."""
@@ -182,7 +195,7 @@ class XYAxes(OrientationBase):
     type: Literal[OrientationType.XYAXES] = OrientationType.XYAXES
     attributes = ("xyaxes",)
 
-    xyaxes: Vec6 = np.array((1, 0, 0, 0, 1, 0))
+    xyaxes: Vec6 = _XYAXES_DEFAULT
     """Orientation of the frame. See Frame orientations."""
 
     def __eq__(self, other: object) -> bool:
@@ -190,6 +203,25 @@ class XYAxes(OrientationBase):
             return NotImplemented
         return np.array_equal(np.asarray(self.xyaxes), np.asarray(other.xyaxes))
 
+    def _to_rotation(self, eulerseq: Optional[EulerSeq | str] = None) -> R:
+        vecs = self.xyaxes
+        x = vecs[:3].astype(float)
+        y = vecs[3:].astype(float)
+
+        # Orthonormalize Y w.r.t X (in place, with scalar norms via dot
+        # products instead of np.linalg.norm, to avoid extra temporaries)
+        x /= math.sqrt(x @ x)
+        y -= (y @ x) * x
+        y /= math.sqrt(y @ y)
+
+        # Build rotation matrix with columns as axes, filling a preallocated
+        # buffer instead of going through column_stack's intermediate copies
+        rotmat = np.empty((3, 3))
+        rotmat[:, 0] = x
+        rotmat[:, 1] = y
+        rotmat[:, 2] = np.cross(x, y)
+        return R.from_matrix(rotmat)
+
 
 class ZAxis(OrientationBase):
     """The Z axis of the frame. The compiler finds the minimal rotation that maps the vector (0,0,1) into the vector specified here. This determines the X and Y axes of the frame implicitly. This is useful for geoms with rotational symmetry around the Z axis, as well as lights - which are oriented along the Z axis of their frame."""
@@ -197,7 +229,7 @@ class ZAxis(OrientationBase):
     type: Literal[OrientationType.ZAXIS] = OrientationType.ZAXIS
     attributes = ("zaxis",)
 
-    zaxis: Vec3 = np.array((0, 0, 1))
+    zaxis: Vec3 = _ZAXIS_DEFAULT
     """Orientation of the frame. See Frame orientations."""
 
     def __eq__(self, other: object) -> bool:
@@ -205,8 +237,103 @@ class ZAxis(OrientationBase):
             return NotImplemented
         return np.array_equal(np.asarray(self.zaxis), np.asarray(other.zaxis))
 
+    def _to_rotation(self, eulerseq: Optional[EulerSeq | str] = None) -> R:
+        z = self.zaxis / np.linalg.norm(self.zaxis)
+
+        # Choose arbitrary x-axis that's not colinear with z
+        if np.allclose(z, [0, 0, 1]):
+            # Already aligned, identity rotation
+            return R.identity()
+        else:
+            # pick temp x along world x-axis
+            tmp = np.array([1.0, 0.0, 0.0])
+            x = np.cross(tmp, z)
+            x /= np.linalg.norm(x)
+
+            rotmat = np.empty((3, 3))
+            rotmat[:, 0] = x
+            rotmat[:, 1] = np.cross(z, x)
+            rotmat[:, 2] = z
+            return R.from_matrix(rotmat)
+
 
 Orientation = Annotated[
     Quat | AxisAngle | Euler | XYAxes | ZAxis, Field(discriminator="type")
 ]
 """Discriminated union for type hinting the various types of Orientations."""
+
+ORIENTATION_CLASSES: dict[OrientationType, type[OrientationBase]] = {
+    OrientationType.QUAT: Quat,
+    OrientationType.AXISANGLE: AxisAngle,
+    OrientationType.XYAXES: XYAxes,
+    OrientationType.ZAXIS: ZAxis,
+    OrientationType.EULER: Euler,
+}
+"""Maps each discriminator value to its orientation class, for O(1) dispatch without touching the union validator."""
+
+
+@cache
+def _orientation_adapter() -> TypeAdapter[Quat | AxisAngle | Euler | XYAxes | ZAxis]:
+    """Build the discriminated-union validator once and reuse it afterwards."""
+
+    return TypeAdapter(Orientation)
+
+
+def parse_orientation(value: Any) -> Quat | AxisAngle | Euler | XYAxes | ZAxis:
+    """Validate loose data (e.g. a dict with a `type` discriminator) into the matching orientation model.
+
+    Uses a single cached union validator instead of constructing a new
+    TypeAdapter per call."""
+
+    return _orientation_adapter().validate_python(value)
+
+
+def as_quats(
+    orientations: Sequence[Quat | AxisAngle | Euler | XYAxes | ZAxis],
+    eulerseq: Optional[EulerSeq | str] = None,
+) -> np.ndarray:
+    """Convert a batch of orientations into an (N, 4) array of (w, x, y, z) quaternions.
+
+    Orientations are grouped by type so that each quaternion, Euler and
+    axis-angle group is converted with a single vectorized call instead of one
+    scipy Rotation per element. Other types fall back to their per-instance
+    conversion."""
+
+    out = np.empty((len(orientations), 4))
+
+    by_type: dict[type, list[int]] = {}
+    for i, orientation in enumerate(orientations):
+        by_type.setdefault(type(orientation), []).append(i)
+
+    for cls_, idx in by_type.items():
+        if cls_ is Quat:
+            quats = np.array([np.asarray(orientations[i].quat, float) for i in idx])
+            norms = np.sqrt((quats * quats).sum(axis=1, keepdims=True))
+            if not norms.all():
+                raise ValueError("Found zero norm quaternions in `quat`.")
+            out[idx] = quats / norms
+
+        elif cls_ is Euler:
+            if eulerseq is None:
+                raise ValueError(
+                    "Unable to return for Euler without specifying the euler angle order (xyz, ZXZ, etc.)"
+                )
+            angles = np.array([np.asarray(orientations[i].euler, float) for i in idx])
+            q = R.from_euler(eulerseq, angles).as_quat()
+            out[idx] = q[:, (3, 0, 1, 2)]
+
+        elif cls_ is AxisAngle:
+            aa = np.array([np.asarray(orientations[i].axisangle, float) for i in idx])
+            axes = aa[:, :3]
+            norms = np.linalg.norm(axes, axis=1, keepdims=True)
+            if not norms.all():
+                raise ValueError("Axis vector cannot be zero for AxisAngle orientation.")
+            q = R.from_rotvec(axes / norms * aa[:, 3:4]).as_quat()
+            out[idx] = q[:, (3, 0, 1, 2)]
+
+        else:
+            for i in idx:
+                q = orientations[i]._to_rotation(eulerseq).as_quat()
+                out[i] = (q[3], q[0], q[1], q[2])
+
+    return out
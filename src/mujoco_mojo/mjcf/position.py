@@ -7,16 +7,24 @@ from mujoco_mojo.typing import Vec3
 
 __all__ = ["Pos"]
 
+# Read-only module-level field default (see mujoco_mojo.mjcf.defaults for the
+# freeze rationale).
+_POS_DEFAULT: Vec3 = np.array((0, 0, 0))
+_POS_DEFAULT.setflags(write=False)
+
 
 class Pos(XMLModel):
     """Defines a model for positions."""
 
     tag = ""
 
-    pos: Vec3 = np.array((0, 0, 0))
+    pos: Vec3 = _POS_DEFAULT
     """Position (in (x, y, z))"""
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Pos):
             return NotImplemented
-        return np.array_equal(np.asarray(self.pos), np.asarray(other.pos))
+
+        # compare as builtin scalars: for a fixed 3-vector this is cheaper
+        # than np.array_equal, which allocates a boolean array and reduces it
+        return np.asarray(self.pos).tolist() == np.asarray(other.pos).tolist()
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import sys
 from enum import StrEnum
-from typing import Annotated, NewType, Tuple
+from typing import Annotated, NamedTuple, NewType, Self
 
 from numpydantic import NDArray, Shape
 from pydantic import Field
@@ -9,12 +10,14 @@ from pydantic import Field
 from mujoco_mojo.utils import is_empty_list
 
 __all__ = [
+    "MojoStrEnum",
     "Vec2",
     "Vec3",
     "Vec4",
     "Vec5",
     "Vec6",
     "VecN",
+    "VecArray3",
     "GridLayoutStr",
     "GeomType",
     "Integrator",
@@ -56,6 +59,7 @@ __all__ = [
     "SiteName",
     "CameraName",
     "LightName",
+    "GroupIndex",
     "ActuatorGroup",
     "GeomGroup",
     "InertiaGroupRange",
@@ -94,14 +98,25 @@ CameraName = NewType("CameraName", str)
 LightName = NewType("LightName", str)
 """Alias of string. Used to type hint a field is the name of a Light."""
 
-ActuatorGroup = Annotated[int, Field(ge=0, le=30)]
+GroupIndex = Annotated[int, Field(ge=0, le=30)]
+"""An integer group index. Must be between 0 and 30 inclusive (MuJoCo packs groups into a 31-bit field)."""
+
+ActuatorGroup = GroupIndex
 """An integer representing an actuator group index. Must be between 0 and 30 inclusive."""
 
-GeomGroup = Annotated[int, Field(ge=0, le=30)]
+GeomGroup = GroupIndex
 """An integer representing a geom group index. Must be between 0 and 30 inclusive."""
 
-InertiaGroupRange = Tuple[GeomGroup, GeomGroup]
-"""A tuple specifying the inclusive range of geom groups used for inertia computation."""
+
+class InertiaGroupRange(NamedTuple):
+    """A tuple specifying the inclusive range of geom groups used for inertia computation.
+
+    Still a plain two-int sequence for validation and XML serialization
+    purposes, but immutable and with named endpoints."""
+
+    first: GeomGroup = 0
+    last: GeomGroup = 5
+
 
 GridLayoutStr = Annotated[
     str,
@@ -130,11 +145,57 @@ Vec6 = Annotated[NDArray[Shape["6"], float | int], ...]
 VecN = Annotated[NDArray[Shape["*"], float | int], ...]  # type: ignore  # noqa: F722
 """An N-element numeric array of arbitrary length."""
 
+VecArray3 = Annotated[NDArray[Shape["*, 3"], float | int], ...]  # type: ignore  # noqa: F722
+"""An (N, 3) array holding a batch of 3-vectors in struct-of-arrays layout.
+
+Prefer this over `list[Vec3]` when handling many vectors at once: one
+contiguous array validates in a single pass and keeps bulk operations
+vectorized."""
+
 
 def empty_list_field():
     return Field(default_factory=list, exclude_if=is_empty_list)
 
 
+class MojoStrEnum(StrEnum):
+    """Base class for the MJCF string enums.
+
+    Adds a case-insensitive fallback for value lookup, so `GeomType("Sphere")`
+    resolves to `GeomType.SPHERE`. Exact matches are still served from the
+    enum's precomputed value map; the lowercase map is built once per class on
+    the first miss."""
+
+    @classmethod
+    def from_value(cls, value: str) -> Self | None:
+        """Fast-path exact value lookup, bypassing `EnumType.__call__`.
+
+        A plain hit on the precomputed value map, skipping the metaclass
+        call protocol (and its _missing_ fallback). Returns None if no member
+        has this exact value."""
+
+        return cls._value2member_map_.get(value)  # type: ignore[return-value]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # intern the member values so repeated comparisons and value-map hits
+        # during (de)serialization resolve by pointer identity
+        for member in cls:
+            member._value_ = sys.intern(member._value_)
+
+    @classmethod
+    def _missing_(cls, value: object):
+        if not isinstance(value, str):
+            return None
+
+        lower_map = cls.__dict__.get("_value2member_lower_")
+        if lower_map is None:
+            lower_map = {member._value_.lower(): member for member in cls}
+            cls._value2member_lower_ = lower_map
+
+        return lower_map.get(value.lower())
+
+
 class EulerSeq(StrEnum):
     """Euler rotation sequences.
 
@@ -199,7 +260,7 @@ class EulerSeq(StrEnum):
     """Extrinsic proper Euler ZYZ"""
 
 
-class LayerRole(StrEnum):
+class LayerRole(MojoStrEnum):
     """Role of the texture. The valid values, expected number of channels, and the role semantics are:"""
 
     RGB = "rgb"
@@ -230,7 +291,7 @@ class LayerRole(StrEnum):
     """4 channels. packed 4 channel [red, green, blue, alpha]."""
 
 
-class GeomType(StrEnum):
+class GeomType(MojoStrEnum):
     """Enumeration of supported geometric types in MuJoCo."""
 
     PLANE = "plane"
@@ -260,7 +321,7 @@ class GeomType(StrEnum):
     """Signed distance field (SDF, also referred to as signed distance function)."""
 
 
-class Integrator(StrEnum):
+class Integrator(MojoStrEnum):
     """Enumeration of simulation integrators."""
 
     EULER = "Euler"
@@ -286,7 +347,7 @@ class Integrator(StrEnum):
     """
 
 
-class Cone(StrEnum):
+class Cone(MojoStrEnum):
     """Cone types used in collision/contact modeling."""
 
     PYRAMIDAL = "pyramidal"
@@ -296,7 +357,7 @@ class Cone(StrEnum):
     """Better model of the physical reality."""
 
 
-class Jacobian(StrEnum):
+class Jacobian(MojoStrEnum):
     """Jacobian computation methods."""
 
     DENSE = "dense"
@@ -309,7 +370,7 @@ class Jacobian(StrEnum):
     """Resolves to dense when the number of degrees of freedom is up to 60, and sparse over 60."""
 
 
-class Solver(StrEnum):
+class Solver(MojoStrEnum):
     """Solver algorithms for constraint resolution."""
 
     PGS = "PGS"
@@ -330,7 +391,7 @@ class Solver(StrEnum):
     """
 
 
-class EnableDisable(StrEnum):
+class EnableDisable(MojoStrEnum):
     """Enable or disable a feature."""
 
     ENABLE = "enable"
@@ -340,21 +401,21 @@ class EnableDisable(StrEnum):
     """Disable the feature."""
 
 
-class Coordinate(StrEnum):
+class Coordinate(MojoStrEnum):
     """In previous versions, this attribute could be used to specify whether frame positions and orientations are expressed in local or global coordinates, but the "global" option has since been removed, and will cause an error to be generated. In order to convert older models which used the "global" option, load and save them in MuJoCo 2.3.3 or older."""
 
     LOCAL = "local"
     GLOBAL = "global"
 
 
-class Angle(StrEnum):
+class Angle(MojoStrEnum):
     """This attribute specifies whether the angles in the MJCF model are expressed in units of degrees or radians. The compiler converts degrees into radians, and mjModel always uses radians. For URDF models the parser sets this attribute to "radian" internally, regardless of the XML setting."""
 
     RADIAN = "radian"
     DEGREE = "degree"
 
 
-class InertiaFromGeom(StrEnum):
+class InertiaFromGeom(MojoStrEnum):
     """This attribute controls the automatic inference of body masses and inertias from geoms attached to the body."""
 
     FALSE = "false"
@@ -367,7 +428,7 @@ class InertiaFromGeom(StrEnum):
     """Masses and inertias are inferred automatically only when the inertial element is missing in the body definition."""
 
 
-class LengthRangeMode(StrEnum):
+class LengthRangeMode(MojoStrEnum):
     """Determines the type of actuators to which length range computation is applied."""
 
     NONE = "none"
@@ -383,7 +444,7 @@ class LengthRangeMode(StrEnum):
     """Applies to all actuators."""
 
 
-class Inertia(StrEnum):
+class Inertia(MojoStrEnum):
     """This attribute controls how the mesh is used when mass and inertia are inferred from geometry. The current default value legacy will be changed to convex in a future release."""
 
     CONVEX = "convex"
@@ -399,7 +460,7 @@ class Inertia(StrEnum):
     """Assume mass is concentrated on the surface of the mesh. Use the mesh's surface to compute the inertia, assuming uniform surface density."""
 
 
-class TextureType(StrEnum):
+class TextureType(MojoStrEnum):
     """This attribute determines how the texture is represented and mapped to objects. It also determines which of the remaining attributes are relevant."""
 
     D2 = "2d"
@@ -412,7 +473,7 @@ class TextureType(StrEnum):
     """Very similar to cube mapping, and in fact the texture data is specified in exactly the same way. The only difference is that the visualizer uses the first such texture defined in the model to render a skybox."""
 
 
-class ColorSpace(StrEnum):
+class ColorSpace(MojoStrEnum):
     """This attribute determines the color space of the texture. The default value auto means that the color space will be determined from the image file itself. If no color space is defined in the file, then linear is assumed."""
 
     AUTO = "auto"
@@ -425,7 +486,7 @@ class ColorSpace(StrEnum):
     """SRGB color space."""
 
 
-class TextureBuiltInType(StrEnum):
+class TextureBuiltInType(MojoStrEnum):
     """This and the remaining attributes control the generation of procedural textures. If the value of this attribute is different from "none", the texture is treated as procedural and any file names are ignored."""
 
     NONE = "none"
@@ -441,7 +502,7 @@ class TextureBuiltInType(StrEnum):
     """Fills the entire texture with rgb1, except for the bottom face of cube and skybox textures which is filled with rgb2."""
 
 
-class Mark(StrEnum):
+class Mark(MojoStrEnum):
     """Procedural textures can be marked with the markrgb color, on top of the colors determined by the builtin type. All markings are one-pixel wide, thus the markings appear larger and more diffuse on smaller textures."""
 
     NONE = "none"
@@ -472,7 +533,7 @@ class Mark(StrEnum):
     See implementation notes for more details."""
 
 
-class Sleep(StrEnum):
+class Sleep(MojoStrEnum):
     """Sleep policy for the tree under this body. This attribute is only supported by moving bodies which are the root of a kinematic tree."""
 
     AUTO = "auto"
@@ -494,7 +555,7 @@ class Sleep(StrEnum):
     """Can only be specified by the user and means "initialize this tree as asleep". This policy is implemented in mj_resetData and mj_makeData and only applies to the default configuration. If a keyframe changes the configuration of (or assigns nonzero velocity to) a sleeping tree, it will be woken up. This policy is useful for very large models where waiting for the automatic sleeping mechanism to kick in can be expensive. Trees initialized as sleeping can be placed in unstable configurations like deep penetration or in mid-air, but will only move when woken up. Also note that this policy can fail. For example if a tree marked as sleep="init" is in contact with a tree not marked as such (i.e., they are in the same island) then it is impossible to put the tree to sleep; such models will lead to a compilation error."""
 
 
-class JointType(StrEnum):
+class JointType(MojoStrEnum):
     """Types of joints supported in MuJoCo."""
 
     FREE = "free"
@@ -510,7 +571,7 @@ class JointType(StrEnum):
     """A hinge joint with one rotational degree of freedom. The rotation takes place around a specified axis through a specified position. This is the most common type of joint and is therefore the default. Most models contain only hinge and free joints."""
 
 
-class Limited(StrEnum):
+class Limited(MojoStrEnum):
     """Specifies if the joint has limits."""
 
     FALSE = "false"
@@ -523,7 +584,7 @@ class Limited(StrEnum):
     """Joint limits will be enabled if range is defined (if autolimits is set in compiler)."""
 
 
-class ActuatorFrcLimited(StrEnum):
+class ActuatorFrcLimited(MojoStrEnum):
     """This attribute specifies whether actuator forces acting on the joint should be clamped. See Force limits for details. It is available only for scalar joints (hinge and slider) and ignored for ball and free joints."""
 
     FALSE = "false"
@@ -536,7 +597,7 @@ class ActuatorFrcLimited(StrEnum):
     """Actuator force clamping will be enabled if actuatorfrcrange is defined (if autolimits is set in compiler)."""
 
 
-class Align(StrEnum):
+class Align(MojoStrEnum):
     """Specifies alignment options for aligning body frame and free joint."""
 
     FALSE = "false"
@@ -549,7 +610,7 @@ class Align(StrEnum):
     """Compiler's alignfree global attribute will be respected."""
 
 
-class FluidShape(StrEnum):
+class FluidShape(MojoStrEnum):
     """Geometry-level fluid interaction model."""
 
     NONE = "none"
@@ -559,7 +620,7 @@ class FluidShape(StrEnum):
     """Activates the geom-level fluid interaction model based on an ellipsoidal approximation of the geom shape. When active, the model based on body inertia sizes is disabled for the body in which the geom is defined. See section on ellipsoid-based fluid interaction model for details."""
 
 
-class TrackingMode(StrEnum):
+class TrackingMode(MojoStrEnum):
     """Specifies how the camera/light position and orientation in world coordinates are computed in forward kinematics (which in turn determine what the camera/light sees)."""
 
     FIXED = "fixed"
@@ -578,7 +639,7 @@ class TrackingMode(StrEnum):
     """The same as "targetbody" but the camera/light is oriented towards the center of mass of the subtree starting at the target body."""
 
 
-class LightType(StrEnum):
+class LightType(MojoStrEnum):
     """Determines the type of light. Note that some light types may not be supported by some renderers (e.g. only spot and directional lights are supported by the default native renderer)."""
 
     SPOT = "spot"
@@ -594,21 +655,21 @@ class LightType(StrEnum):
     """Not supported by default native renderer"""
 
 
-class CompositeType(StrEnum):
+class CompositeType(MojoStrEnum):
     CABLE = "cable"
 
 
-class CompositeInitial(StrEnum):
+class CompositeInitial(MojoStrEnum):
     FREE = "free"
     BALL = "ball"
     NONE = "none"
 
 
-class CompositeJointKind(StrEnum):
+class CompositeJointKind(MojoStrEnum):
     MAIN = "main"
 
 
-class FlexCompDOF(StrEnum):
+class FlexCompDOF(MojoStrEnum):
     """The parametrization of the flex's degrees of freedom (dofs)."""
 
     FULL = "full"
@@ -621,7 +682,7 @@ class FlexCompDOF(StrEnum):
     """Three translational dofs at each corner of the bounding box of the flex, for a total of 24 dofs for the entire flex, independent of the number of vertices. The positions of the vertices are updated using trilinear interpolation over the bounding box."""
 
 
-class FlexCompType(StrEnum):
+class FlexCompType(MojoStrEnum):
     """The type of flexcomp object."""
 
     GRID = "grid"
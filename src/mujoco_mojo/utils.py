@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from enum import StrEnum, auto
+import sys
+from enum import StrEnum
 from typing import Any
-from xml.dom import minidom
-from xml.etree.ElementTree import tostring
+from xml.etree.ElementTree import Element
+from xml.sax.saxutils import escape
 
 __all__ = ["Color", "SimStatus", "to_pretty_xml"]
 
@@ -22,22 +23,72 @@ class Color(StrEnum):
     NC = "\033[0m"
 
 
+# prog_bar slices these instead of multiplying fresh bar strings on every
+# call; bars wider than this fall back to multiplication
+_BAR_MAX_WIDTH = 120
+_BAR_FULL = "█" * _BAR_MAX_WIDTH
+_BAR_EMPTY = "░" * _BAR_MAX_WIDTH
+
+
 class SimStatus(StrEnum):
-    RUNNING = auto()
-    NORMAL_TERMINATION = auto()
-    ERROR_TERMINATION = auto()
+    RUNNING = "running"
+    NORMAL_TERMINATION = "normal_termination"
+    ERROR_TERMINATION = "error_termination"
 
     @classmethod
     def prog_bar(cls, p: float, width: int = 40) -> str:
         p = min(max(0, p), 1)
         filled_length = int(width * p)
+        if width <= _BAR_MAX_WIDTH:
+            return f"[{_BAR_FULL[:filled_length]}{_BAR_EMPTY[:width - filled_length]}]"
         return f"[{'█' * filled_length}{'░' * (width - filled_length)}]"
 
 
-def to_pretty_xml(element) -> str:
-    rough = tostring(element, "utf-8")
-    reparsed = minidom.parseString(rough)
-    return reparsed.toprettyxml(indent="  ")
+# intern the member values so status comparisons resolve by pointer
+# (mujoco_mojo.typing enums get the same treatment from MojoStrEnum, which
+# this module cannot import without a cycle)
+for _member in SimStatus:
+    _member._value_ = sys.intern(_member._value_)
+
+
+def to_pretty_xml(element: Element) -> str:
+    """Serialize an Element tree to an indented XML string.
+
+    Walks the tree directly instead of round-tripping through
+    minidom.parseString / toprettyxml, which built a second DOM tree only to
+    re-serialize it. Output matches the old minidom formatting for the
+    attribute-only elements MJCF produces.
+
+    The walk is iterative: deeply nested body trees would otherwise recurse
+    once per level. Stack entries are either ``(element, indent)`` pairs still
+    to visit or ready-made closing-tag strings."""
+
+    parts = ['<?xml version="1.0" ?>\n']
+    stack: list[str | tuple[Element, str]] = [(element, "")]
+
+    while stack:
+        entry = stack.pop()
+
+        if isinstance(entry, str):
+            parts.append(entry)
+            continue
+
+        node, indent = entry
+        parts.append(f"{indent}<{node.tag}")
+
+        for key, value in node.attrib.items():
+            parts.append(f' {key}="{escape(value, {'"': "&quot;"})}"')
+
+        if len(node):
+            parts.append(">\n")
+            stack.append(f"{indent}</{node.tag}>\n")
+            child_indent = indent + "  "
+            for child in reversed(node):
+                stack.append((child, child_indent))
+        else:
+            parts.append("/>\n")
+
+    return "".join(parts)
 
 
 def is_empty_list(v: Any) -> bool:
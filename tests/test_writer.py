@@ -1,4 +1,6 @@
+import io
 from pathlib import Path
+from xml.etree.ElementTree import canonicalize, tostring
 
 import mujoco
 import numpy as np
@@ -6,6 +8,7 @@ import numpy as np
 import mujoco_mojo as mojo
 import mujoco_mojo.mjcf as mjcf
 import mujoco_mojo.typing as mojot
+from mujoco_mojo.mjcf.orientation import as_quats, parse_orientation
 
 
 def test_import():
@@ -81,3 +84,27 @@ sphere = type(sphere).model_validate_json(json_file.with_stem("sphere").read_tex
 
 json_file.write_text(model.model_dump_json(exclude_none=True))
 model = type(model).model_validate_json(json_file.read_text())
+
+
+# =============== streaming writer matches the element tree ===============
+stream = io.StringIO()
+model.write_xml(stream)
+assert canonicalize(stream.getvalue()) == canonicalize(tostring(model.to_xml())), (
+    "write_xml output differs from to_xml"
+)
+
+
+# =============== batched orientation conversion ===============
+orientations = [
+    quat,
+    mjcf.AxisAngle(axisangle=np.array((0, 1, 0, 1.2))),
+    mjcf.Euler(euler=np.array((0.1, 0.2, 0.3))),
+]
+batched = as_quats(orientations, eulerseq="xyz")
+for row, orientation in zip(batched, orientations):
+    np.testing.assert_allclose(
+        row, np.asarray(orientation.as_quat(eulerseq="xyz").quat)
+    )
+
+parsed = parse_orientation({"type": "quat", "quat": (1, 2, 3, 4)})
+assert isinstance(parsed, mjcf.Quat), "parse_orientation did not dispatch on type"